@@ -1,3 +1,7 @@
+from heapq import heapify, heappop, heappush
+import math
+
+
 class Banco:
     """Clase que maneja las validaciones y operaciones bancarias"""
     
@@ -6,6 +10,12 @@ class Banco:
         self.limite_diario = 10000  # Límite diario de transacciones
         self.max_transacciones = 10  # Máximo número de transacciones diarias
         
+        # Agregados mantenidos en cada operación para reportes sin recorrer las cuentas
+        self.saldo_total = 0
+        self.depositos_hoy = 0
+        self.cuentas_por_estado = {'activa': 0, 'bloqueada': 0}
+        self.heap_saldos = []  # Montículo de tuplas (-saldo, numero_cuenta) con eliminación perezosa
+        
     def validar_numero_cuenta(self, numero_cuenta: str) -> bool:
         """
         Valida que el número de cuenta tenga el formato correcto
@@ -80,11 +90,42 @@ class Banco:
             'nombre': nombre,
             'saldo': 0,
             'estado': 'activa',
-            'transacciones_hoy': 0
+            'transacciones_hoy': 0,
+            'depositos_hoy': 0
         }
         self.cuentas[numero_cuenta] = nueva_cuenta
+        self.cuentas_por_estado['activa'] += 1
+        heappush(self.heap_saldos, (0, numero_cuenta))
         return nueva_cuenta
         
+    def _actualizar_saldo(self, cuenta: dict, delta: float) -> None:
+        """
+        Aplica un cambio de saldo a la cuenta y a los agregados del banco.
+        
+        La entrada anterior de la cuenta en el montículo no se elimina: queda
+        obsoleta y se descarta al consultar, por lo que cada actualización cuesta
+        O(log n). Cuando las entradas superan el doble de las cuentas, el montículo
+        se compacta en O(n), lo que en promedio no cambia ese costo.
+        
+        No se detectan ni se reparan saldos modificados fuera del banco; esa
+        inconsistencia solo la reporta verificar_agregados.
+        """
+        cuenta['saldo'] += delta
+        self.saldo_total += delta
+        heappush(self.heap_saldos, (-cuenta['saldo'], cuenta['numero']))
+        
+        if len(self.heap_saldos) > 2 * len(self.cuentas):
+            self.heap_saldos = [(-c['saldo'], numero) for numero, c in self.cuentas.items()]
+            heapify(self.heap_saldos)
+        
+    def _cambiar_estado(self, cuenta: dict, estado: str) -> None:
+        """
+        Cambia el estado de la cuenta y actualiza el conteo por estado
+        """
+        self.cuentas_por_estado[cuenta['estado']] -= 1
+        cuenta['estado'] = estado
+        self.cuentas_por_estado[estado] += 1
+        
     def depositar(self, numero_cuenta: str, monto: float) -> bool:
         """
         Realiza un depósito en la cuenta
@@ -104,7 +145,9 @@ class Banco:
         if not self.validar_transacciones_diarias(cuenta):
             return False
             
-        cuenta['saldo'] += monto
+        self._actualizar_saldo(cuenta, monto)
+        self.depositos_hoy += monto
+        cuenta['depositos_hoy'] += monto
         cuenta['transacciones_hoy'] += 1
         print(f"Depósito exitoso. Nuevo saldo: ${cuenta['saldo']}")
         return True
@@ -131,7 +174,7 @@ class Banco:
         if not self.validar_transacciones_diarias(cuenta):
             return False
             
-        cuenta['saldo'] -= monto
+        self._actualizar_saldo(cuenta, -monto)
         cuenta['transacciones_hoy'] += 1
         print(f"Retiro exitoso. Nuevo saldo: ${cuenta['saldo']}")
         return True
@@ -160,8 +203,8 @@ class Banco:
             return False
             
         # Realizar la transferencia
-        origen['saldo'] -= monto
-        destino['saldo'] += monto
+        self._actualizar_saldo(origen, -monto)
+        self._actualizar_saldo(destino, monto)
         origen['transacciones_hoy'] += 1
         destino['transacciones_hoy'] += 1
         
@@ -177,7 +220,7 @@ class Banco:
             print("Error: Cuenta no encontrada")
             return False
             
-        self.cuentas[numero_cuenta]['estado'] = 'bloqueada'
+        self._cambiar_estado(self.cuentas[numero_cuenta], 'bloqueada')
         print("Cuenta bloqueada exitosamente")
         return True
         
@@ -189,9 +232,82 @@ class Banco:
             print("Error: Cuenta no encontrada")
             return False
             
-        self.cuentas[numero_cuenta]['estado'] = 'activa'
+        self._cambiar_estado(self.cuentas[numero_cuenta], 'activa')
         print("Cuenta desbloqueada exitosamente")
         return True
+        
+    def reiniciar_dia(self) -> None:
+        """
+        Reinicia los contadores diarios del banco y de cada cuenta
+        """
+        self.depositos_hoy = 0
+        for cuenta in self.cuentas.values():
+            cuenta['transacciones_hoy'] = 0
+            cuenta['depositos_hoy'] = 0
+        
+    def contar_cuentas(self, estado: str) -> int:
+        """
+        Retorna el número de cuentas en el estado indicado
+        """
+        return self.cuentas_por_estado.get(estado, 0)
+        
+    def top_cuentas_por_saldo(self, n: int) -> list:
+        """
+        Retorna pares (numero_cuenta, saldo) de las n cuentas con mayor saldo, de mayor a menor.
+        Los empates se ordenan por número de cuenta ascendente.
+        
+        Una cuenta cuyo saldo se modificó fuera del banco no aparece hasta su
+        siguiente operación.
+        """
+        resultado = []
+        vigentes = []
+        vistas = set()
+        while self.heap_saldos and len(resultado) < n:
+            entrada = heappop(self.heap_saldos)
+            saldo, numero = -entrada[0], entrada[1]
+            
+            # Las entradas obsoletas o repetidas se descartan definitivamente
+            if numero in vistas or self.cuentas[numero]['saldo'] != saldo:
+                continue
+                
+            vistas.add(numero)
+            vigentes.append(entrada)
+            resultado.append((numero, saldo))
+            
+        for entrada in vigentes:
+            heappush(self.heap_saldos, entrada)
+            
+        return resultado
+        
+    def verificar_agregados(self) -> bool:
+        """
+        Compara los agregados mantenidos contra un recálculo completo de las cuentas
+        """
+        saldo_total = sum(cuenta['saldo'] for cuenta in self.cuentas.values())
+        depositos_hoy = sum(cuenta['depositos_hoy'] for cuenta in self.cuentas.values())
+        cuentas_por_estado = {'activa': 0, 'bloqueada': 0}
+        for cuenta in self.cuentas.values():
+            cuentas_por_estado[cuenta['estado']] += 1
+        cuentas_indexadas = {numero for saldo, numero in self.heap_saldos
+                             if self.cuentas[numero]['saldo'] == -saldo}
+        
+        if not math.isclose(saldo_total, self.saldo_total, abs_tol=1e-9):
+            print("Error: El saldo total no coincide con las cuentas")
+            return False
+            
+        if not math.isclose(depositos_hoy, self.depositos_hoy, abs_tol=1e-9):
+            print("Error: Los depósitos del día no coinciden con las cuentas")
+            return False
+            
+        if cuentas_por_estado != self.cuentas_por_estado:
+            print("Error: El conteo de cuentas por estado no coincide")
+            return False
+            
+        if cuentas_indexadas != set(self.cuentas):
+            print("Error: El índice de saldos no coincide con las cuentas")
+            return False
+            
+        return True
 
 # Ejemplo de uso
 if __name__ == "__main__":
@@ -228,4 +344,10 @@ if __name__ == "__main__":
     
     print("\nEstado final de las cuentas:")
     for numero, cuenta in banco.cuentas.items():
-        print(f"Cuenta {numero}: Saldo = ${cuenta['saldo']}, Estado = {cuenta['estado']}, Transacciones hoy = {cuenta['transacciones_hoy']}")
\ No newline at end of file
+        print(f"Cuenta {numero}: Saldo = ${cuenta['saldo']}, Estado = {cuenta['estado']}, Transacciones hoy = {cuenta['transacciones_hoy']}")
+        
+    print("\nReporte del banco:")
+    print(f"Saldo total = ${banco.saldo_total}, Depósitos hoy = ${banco.depositos_hoy}")
+    print(f"Cuentas bloqueadas = {banco.contar_cuentas('bloqueada')}")
+    print(f"Cuentas con mayor saldo = {banco.top_cuentas_por_saldo(1)}")
+    print(f"Agregados consistentes = {banco.verificar_agregados()}")
\ No newline at end of file
@@ -0,0 +1,170 @@
+from pathlib import Path
+import sys
+
+# Permite importar el paquete testing al ejecutar este archivo con pytest o python desde cualquier directorio
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from testing.tests import Banco
+
+def test_caso_1_banco_vacio():
+    """Consultar los agregados de un banco sin cuentas"""
+    banco = Banco()
+    assert banco.saldo_total == 0
+    assert banco.depositos_hoy == 0
+    assert banco.contar_cuentas('activa') == 0
+    assert banco.contar_cuentas('bloqueada') == 0
+    assert banco.top_cuentas_por_saldo(3) == []
+    assert banco.verificar_agregados()
+
+def test_caso_2_contar_cuentas_por_estado():
+    """Bloquear y desbloquear cuentas actualiza el conteo por estado"""
+    banco = Banco()
+    banco.crear_cuenta("1111111111", "Cliente 1")
+    banco.crear_cuenta("2222222222", "Cliente 2")
+    banco.bloquear_cuenta("1111111111")
+    banco.bloquear_cuenta("1111111111")  # Bloquear dos veces no duplica el conteo
+    assert banco.contar_cuentas('activa') == 1
+    assert banco.contar_cuentas('bloqueada') == 1
+
+    banco.desbloquear_cuenta("1111111111")
+    assert banco.contar_cuentas('activa') == 2
+    assert banco.contar_cuentas('bloqueada') == 0
+    assert banco.contar_cuentas('inexistente') == 0
+    assert banco.verificar_agregados()
+
+def test_caso_3_top_cuentas_por_saldo():
+    """Las cuentas se ordenan por saldo y los empates por número de cuenta"""
+    banco = Banco()
+    banco.crear_cuenta("1111111111", "Cliente 1")
+    banco.crear_cuenta("2222222222", "Cliente 2")
+    banco.crear_cuenta("3333333333", "Cliente 3")
+    banco.depositar("1111111111", 500)
+    banco.depositar("2222222222", 300)
+    banco.depositar("3333333333", 300)
+
+    assert banco.top_cuentas_por_saldo(0) == []
+    assert banco.top_cuentas_por_saldo(1) == [("1111111111", 500)]
+    assert banco.top_cuentas_por_saldo(10) == [
+        ("1111111111", 500),
+        ("2222222222", 300),
+        ("3333333333", 300),
+    ]
+
+def test_caso_4_saldo_total_y_depositos_hoy():
+    """Depósitos, retiros y transferencias mantienen los totales"""
+    banco = Banco()
+    banco.crear_cuenta("1111111111", "Cliente 1")
+    banco.crear_cuenta("2222222222", "Cliente 2")
+    banco.depositar("1111111111", 1000)
+    banco.depositar("2222222222", 400)
+    banco.retirar("1111111111", 300)
+    banco.transferir("1111111111", "2222222222", 200)
+    banco.retirar("2222222222", 5000)  # Debería fallar sin alterar los totales
+
+    assert banco.saldo_total == 1100
+    assert banco.depositos_hoy == 1400
+    assert banco.verificar_agregados()
+
+def test_caso_5_transferencia_a_la_misma_cuenta():
+    """Transferir a la misma cuenta no altera el saldo ni el índice"""
+    banco = Banco()
+    banco.crear_cuenta("1111111111", "Cliente 1")
+    banco.depositar("1111111111", 1000)
+    banco.transferir("1111111111", "1111111111", 400)
+
+    assert banco.cuentas["1111111111"]['saldo'] == 1000
+    assert banco.saldo_total == 1000
+    assert banco.top_cuentas_por_saldo(1) == [("1111111111", 1000)]
+    assert banco.verificar_agregados()
+
+def test_caso_6_reiniciar_dia():
+    """Reiniciar el día pone en cero los contadores diarios"""
+    banco = Banco()
+    banco.crear_cuenta("1111111111", "Cliente 1")
+    banco.depositar("1111111111", 1000)
+    banco.reiniciar_dia()
+
+    assert banco.depositos_hoy == 0
+    assert banco.cuentas["1111111111"]['transacciones_hoy'] == 0
+    assert banco.saldo_total == 1000
+    assert banco.verificar_agregados()
+
+    banco.depositar("1111111111", 200)
+    assert banco.depositos_hoy == 200
+
+def test_caso_7_agregados_alterados():
+    """Modificar los agregados directamente se detecta en la verificación"""
+    banco = Banco()
+    banco.crear_cuenta("1111111111", "Cliente 1")
+    banco.depositar("1111111111", 1000)
+
+    banco.saldo_total += 1
+    assert not banco.verificar_agregados()
+    banco.saldo_total -= 1
+
+    banco.depositos_hoy = 0
+    assert not banco.verificar_agregados()
+    banco.depositos_hoy = 1000
+
+    banco.cuentas_por_estado['bloqueada'] = 1
+    assert not banco.verificar_agregados()
+    banco.cuentas_por_estado['bloqueada'] = 0
+
+    respaldo = list(banco.heap_saldos)
+    banco.heap_saldos.clear()
+    assert not banco.verificar_agregados()
+    banco.heap_saldos = respaldo
+
+    assert banco.verificar_agregados()
+
+def test_caso_8_saldo_modificado_fuera_del_banco():
+    """Un saldo modificado directamente en la cuenta se reporta y no se repara en silencio"""
+    banco = Banco()
+    banco.crear_cuenta("1111111111", "Cliente 1")
+    banco.crear_cuenta("2222222222", "Cliente 2")
+    banco.crear_cuenta("3333333333", "Cliente 3")
+    banco.depositar("2222222222", 500)
+    banco.depositar("3333333333", 700)
+
+    banco.cuentas["1111111111"]['saldo'] = 999999
+    assert not banco.verificar_agregados()
+    assert banco.top_cuentas_por_saldo(3) == [
+        ("3333333333", 700),
+        ("2222222222", 500),
+    ]
+
+    # Operar sobre la cuenta no oculta la diferencia en el saldo total
+    banco.depositar("1111111111", 1)
+    assert banco.top_cuentas_por_saldo(1) == [("1111111111", 1000000)]
+    assert banco.saldo_total == 1201
+    assert not banco.verificar_agregados()
+
+def test_caso_9_saldos_fraccionarios_en_cero():
+    """Volver todos los saldos a cero con montos fraccionarios no es una inconsistencia"""
+    banco = Banco()
+    banco.crear_cuenta("1111111111", "Cliente 1")
+    banco.crear_cuenta("2222222222", "Cliente 2")
+    banco.depositar("1111111111", 0.1)
+    banco.depositar("2222222222", 0.2)
+    banco.retirar("1111111111", 0.1)
+    banco.retirar("2222222222", 0.2)
+
+    assert banco.cuentas["1111111111"]['saldo'] == 0
+    assert banco.cuentas["2222222222"]['saldo'] == 0
+    assert banco.verificar_agregados()
+
+def main():
+    print("=== Iniciando pruebas de agregados del banco ===")
+    test_caso_1_banco_vacio()
+    test_caso_2_contar_cuentas_por_estado()
+    test_caso_3_top_cuentas_por_saldo()
+    test_caso_4_saldo_total_y_depositos_hoy()
+    test_caso_5_transferencia_a_la_misma_cuenta()
+    test_caso_6_reiniciar_dia()
+    test_caso_7_agregados_alterados()
+    test_caso_8_saldo_modificado_fuera_del_banco()
+    test_caso_9_saldos_fraccionarios_en_cero()
+    print("\n=== Pruebas completadas ===")
+
+if __name__ == "__main__":
+    main()